@@ -34,82 +34,172 @@ For detailed usage and workflows, run: vibe --help
 """
 
 import argparse
+import collections
+import functools
 import json
 import os
+import re
 import sys
-import urllib.request
-import urllib.error
-from urllib.parse import urlencode, urlparse
-from pathlib import Path
+
+# http.client and urllib.parse are imported at their point of use:
+# http.client pulls in the email package, which dominates startup for
+# --help and argument errors that never reach the network.
 
 DEFAULT_BASE_URL = "http://localhost:3000/api"
 REQUEST_TIMEOUT = 30  # seconds
 
+STATUS_CHOICES = ("todo", "in-progress", "in-review", "done", "cancelled")
+EXECUTOR_CHOICES = ("CLAUDE_CODE", "CODEX", "GEMINI", "CURSOR_AGENT", "OPENCODE")
+
+# Look for vibe-kanban server processes (both dev and production)
+# Production: dist/vibe-kanban binary or platform-specific binaries
+# Development: target/debug/server or target/release/server binary
+#
+# We need to be specific to avoid matching node processes that happen
+# to have vibe-kanban in their path (like esbuild in node_modules)
+SERVER_PROCESS_PATTERN = re.compile(
+    r'(?:'
+    r'target/(?:debug|release)/server\b'  # Dev server binary
+    r'|dist/vibe-kanban\b'                 # Production binary in dist
+    r'|(?:macos|linux|windows)-[^/]+/vibe-kanban\b'  # Platform-specific binary
+    r')'
+)
+# Processes that can mention a server path without being a server
+EXCLUDED_PROCESS_PATTERN = re.compile(r'grep|vibe-cli|npm exec')
+
+# The API base URL, parsed once: url is kept verbatim for messages and
+# base_path (e.g. "/api") is prefixed to every request path
+ApiServer = collections.namedtuple("ApiServer", ["url", "scheme", "host", "port", "base_path"])
+
 
 def get_version():
     """Get version string based on file modification time."""
     from datetime import datetime
-    script_path = Path(__file__).resolve()
-    mtime = script_path.stat().st_mtime
+    mtime = os.path.getmtime(os.path.realpath(__file__))
     dt = datetime.fromtimestamp(mtime)
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@functools.lru_cache(maxsize=1)
 def get_port_file_path():
     """Get the path to the vibe-kanban port file."""
     import tempfile
-    return Path(tempfile.gettempdir()) / "vibe-kanban" / "vibe-kanban.port"
+    return os.path.join(tempfile.gettempdir(), "vibe-kanban", "vibe-kanban.port")
+
+
+def list_process_commands():
+    """List the command lines of running processes.
+
+    Reads /proc directly on Linux, uses psutil when it is installed, and
+    otherwise falls back to a single `ps` call that only prints commands.
+    """
+    if os.path.isdir("/proc"):
+        commands = []
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                # Process exited or is not readable by this user
+                continue
+            if cmdline:
+                commands.append(cmdline.replace(b"\0", b" ").decode(errors="replace"))
+        return commands
 
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return [
+            " ".join(proc.info["cmdline"] or ())
+            for proc in psutil.process_iter(["cmdline"])
+        ]
 
-def count_running_servers():
-    """Count running vibe-kanban server processes using ps."""
     import subprocess
-    import re
     try:
         result = subprocess.run(
-            ["ps", "aux"],
+            ["ps", "-A", "-o", "command="],
             capture_output=True,
             text=True,
             timeout=5
         )
-        # Look for vibe-kanban server processes (both dev and production)
-        # Production: dist/vibe-kanban binary or platform-specific binaries
-        # Development: target/debug/server or target/release/server binary
-        #
-        # We need to be specific to avoid matching node processes that happen
-        # to have vibe-kanban in their path (like esbuild in node_modules)
-        server_pattern = re.compile(
-            r'(?:'
-            r'target/(?:debug|release)/server\b'  # Dev server binary
-            r'|dist/vibe-kanban\b'                 # Production binary in dist
-            r'|(?:macos|linux|windows)-[^/]+/vibe-kanban\b'  # Platform-specific binary
-            r')'
-        )
-        lines = [
-            line for line in result.stdout.splitlines()
-            if server_pattern.search(line)
-            and "grep" not in line
-        ]
-        return len(lines)
+        return result.stdout.splitlines()
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        return 0
+        return []
+
+
+def count_running_servers():
+    """Count running vibe-kanban server processes."""
+    return sum(
+        1 for line in list_process_commands()
+        if SERVER_PROCESS_PATTERN.search(line)
+        and not EXCLUDED_PROCESS_PATTERN.search(line)
+    )
 
 
 def discover_port():
     """Try to discover the server port from the port file."""
     try:
-        port_file = get_port_file_path()
-        if port_file.exists():
-            port = port_file.read_text().strip()
-            if port.isdigit():
-                return int(port)
-    except (IOError, ValueError):
+        with open(get_port_file_path(), "rb") as f:
+            port = f.read(16).strip()
+        if port.isdigit():
+            return int(port)
+    except (OSError, ValueError):
         pass
     return None
 
 
+def get_single_server_marker_path():
+    """Get the path to the marker left by a scan that found one server."""
+    return get_port_file_path() + ".single"
+
+
+def get_port_file_stamp():
+    """Identify the last write of the port file by its modification time."""
+    try:
+        return str(os.stat(get_port_file_path()).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def is_single_server_verified(stamp):
+    """Check whether a scan already found one server for this port file write.
+
+    Every server rewrites the port file on startup, so if the port file has
+    not changed since a scan saw exactly one server, no second server can
+    have started since.
+    """
+    if stamp is None:
+        return False
+    try:
+        with open(get_single_server_marker_path()) as f:
+            return f.read() == stamp
+    except OSError:
+        return False
+
+
+def mark_single_server_verified(stamp):
+    """Record that a scan found one server for this port file write."""
+    if stamp is None:
+        return
+    try:
+        with open(get_single_server_marker_path(), "w") as f:
+            f.write(stamp)
+    except OSError:
+        # Best effort: without the marker the next invocation just rescans
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_base_url():
-    """Get the API base URL, with auto-discovery support."""
+    """Get the API base URL, with auto-discovery support.
+
+    Cached: the server cannot change during one CLI invocation, so discovery
+    runs once even when a command (like `tasks wait`) makes many requests.
+    """
     # First check explicit env var
     env_url = os.environ.get("VIBE_API_URL")
     if env_url:
@@ -118,8 +208,15 @@ def get_base_url():
     # Try to discover port from port file
     discovered_port = discover_port()
     if discovered_port:
-        # Check for multiple running servers
+        # Check for multiple running servers, unless no server has started
+        # since a previous scan found only one
+        stamp = get_port_file_stamp()
+        if is_single_server_verified(stamp):
+            return f"http://127.0.0.1:{discovered_port}/api"
+
         server_count = count_running_servers()
+        if server_count == 1:
+            mark_single_server_verified(stamp)
         if server_count > 1:
             print(f"Error: {server_count} vibe-kanban servers detected!", file=sys.stderr)
             print("", file=sys.stderr)
@@ -134,13 +231,21 @@ def get_base_url():
     return DEFAULT_BASE_URL
 
 
-def format_connection_error(base_url):
-    """Format a helpful connection error message."""
+@functools.lru_cache(maxsize=1)
+def get_api_server():
+    """Get the parsed API base URL."""
+    from urllib.parse import urlparse
+    base_url = get_base_url()
     parsed = urlparse(base_url)
-    port = parsed.port or 80
+    return ApiServer(base_url, parsed.scheme, parsed.hostname, parsed.port, parsed.path.rstrip("/"))
+
+
+def format_connection_error(server):
+    """Format a helpful connection error message."""
+    port = server.port or 80
 
     lines = [
-        f"Connection failed: {base_url}",
+        f"Connection failed: {server.url}",
         "",
         "Possible causes:",
         f"  1. Server is not running",
@@ -160,49 +265,131 @@ def format_connection_error(base_url):
     return "\n".join(lines)
 
 
-def api_request(method, endpoint, data=None, params=None):
-    """Make an API request and return JSON response."""
-    base_url = get_base_url()
-    url = f"{base_url}{endpoint}"
-    if params:
-        url += "?" + urlencode(params)
+# Shared keep-alive connection, reused by every api_request() in this process
+_CONN = None
+
 
-    headers = {"Content-Type": "application/json"}
-    body = json.dumps(data).encode() if data else None
+def _get_conn(server):
+    """Get the shared connection to the API server, creating it on first use."""
+    global _CONN
+    if _CONN is None:
+        import http.client
+        if server.scheme == "https":
+            conn_class = http.client.HTTPSConnection
+        else:
+            conn_class = http.client.HTTPConnection
+        _CONN = conn_class(server.host, server.port, timeout=REQUEST_TIMEOUT)
+    return _CONN
 
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
 
+def _send_request(server, method, path, body, headers):
+    """Send a request over the shared connection and return (status, body bytes)."""
+    import http.client
+    conn = _get_conn(server)
+    # http.client keeps the socket open between requests only for keep-alive
+    reused = conn.sock is not None
     try:
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-            content = response.read().decode()
-            return json.loads(content) if content else None
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
-        try:
-            error_json = json.loads(error_body)
-            # Extract meaningful error message
-            if isinstance(error_json, dict):
-                msg = error_json.get("message") or error_json.get("error") or error_json
-                if error_json.get("error_data"):
-                    msg = f"{msg}: {error_json['error_data']}"
-                print(f"Error {e.code}: {msg}", file=sys.stderr)
-            else:
-                print(f"Error {e.code}: {json.dumps(error_json, indent=2)}", file=sys.stderr)
-        except json.JSONDecodeError:
-            print(f"Error {e.code}: {error_body}", file=sys.stderr)
-        sys.exit(1)
-    except urllib.error.URLError as e:
-        print(format_connection_error(base_url), file=sys.stderr)
-        sys.exit(1)
+        conn.request(method, path, body, headers)
+        response = conn.getresponse()
+    except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+        # A fresh socket failing means the server really failed the request,
+        # and resending could repeat a non-idempotent POST
+        if not reused:
+            raise
+        # The server dropped the idle keep-alive socket; reconnect once
+        conn.close()
+        conn.request(method, path, body, headers)
+        response = conn.getresponse()
+    # The body must be fully read before the connection can be reused
+    return response.status, response.read()
+
+
+def _extract_err_msg(error_json):
+    """Extract a meaningful message from a JSON error body, or None."""
+    try:
+        msg = error_json.get("message") or error_json.get("error") or error_json
+    except AttributeError:
+        # Not a JSON object (e.g. a bare string or list)
+        return None
+    if error_json.get("error_data"):
+        msg = f"{msg}: {error_json['error_data']}"
+    return msg
+
+
+def api_request(method, endpoint, data=None, params=None, raw=False):
+    """Make an API request and return JSON response.
+
+    With raw=True the response body is returned as undecoded bytes, for
+    callers that only pass it through to stdout.
+    """
+    import http.client
+
+    server = get_api_server()
+    path = server.base_path + endpoint
+    if params:
+        from urllib.parse import urlencode
+        path += "?" + urlencode(params)
+
+    # http.client sends Content-Length for the body, and Content-Length: 0
+    # for a bodyless POST/PUT, so requests are never chunked
+    headers = {"Connection": "keep-alive"}
+    body = None
+    if data is not None:
+        headers["Content-Type"] = "application/json"
+        body = json.dumps(data, separators=(",", ":")).encode()
+
+    try:
+        status, content = _send_request(server, method, path, body, headers)
     except TimeoutError:
         print(f"Request timed out after {REQUEST_TIMEOUT}s", file=sys.stderr)
-        print(f"The server at {base_url} may be unresponsive", file=sys.stderr)
+        print(f"The server at {server.url} may be unresponsive", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, http.client.HTTPException):
+        print(format_connection_error(server), file=sys.stderr)
         sys.exit(1)
 
+    if status >= 400:
+        error_body = content.decode()
+        try:
+            msg = _extract_err_msg(json.loads(error_body))
+        except json.JSONDecodeError:
+            msg = None
+        # Fall back to the body as received rather than re-serializing it
+        print(f"Error {status}: {msg or error_body}", file=sys.stderr)
+        sys.exit(1)
+
+    if raw:
+        return content
+    content = content.decode()
+    return json.loads(content) if content else None
 
-def print_json(data):
-    """Pretty print JSON data."""
-    print(json.dumps(data, indent=2))
+
+def print_json(data, pretty=True):
+    """Print JSON data, indented unless pretty is False.
+
+    Uses orjson when it is installed.
+    """
+    try:
+        import orjson
+        output = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    except (ImportError, TypeError):
+        # No orjson, or data it cannot encode (e.g. integers wider than 64 bits)
+        if pretty:
+            print(json.dumps(data, indent=2))
+        else:
+            print(json.dumps(data, separators=(",", ":")))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output + b"\n")
+
+
+def print_raw_json(content, pretty=False):
+    """Print a raw JSON response body, reformatting it only when pretty."""
+    if pretty:
+        print_json(json.loads(content) if content else None)
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(content + b"\n")
 
 
 # =============================================================================
@@ -211,14 +398,14 @@ def print_json(data):
 
 def cmd_projects_list(args):
     """List all projects."""
-    result = api_request("GET", "/projects")
-    print_json(result)
+    result = api_request("GET", "/projects", raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_projects_get(args):
     """Get a specific project."""
-    result = api_request("GET", f"/projects/{args.id}")
-    print_json(result)
+    result = api_request("GET", f"/projects/{args.id}", raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_projects_create(args):
@@ -276,14 +463,14 @@ def cmd_tasks_list(args):
     if args.status:
         params["status"] = args.status
 
-    result = api_request("GET", "/tasks", params=params)
-    print_json(result)
+    result = api_request("GET", "/tasks", params=params, raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_tasks_get(args):
     """Get a specific task."""
-    result = api_request("GET", f"/tasks/{args.id}")
-    print_json(result)
+    result = api_request("GET", f"/tasks/{args.id}", raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_tasks_create(args):
@@ -347,11 +534,29 @@ def cmd_tasks_delete(args):
     print(f"Task {args.id} deleted")
 
 
+def cmd_tasks_delete_many(args):
+    """Delete tasks whose IDs are read from stdin, one per line."""
+    task_ids = [line.strip() for line in sys.stdin if line.strip()]
+    if not task_ids:
+        print("Error: No task IDs given on stdin", file=sys.stderr)
+        sys.exit(1)
+
+    # All deletes share api_request's keep-alive connection
+    for task_id in task_ids:
+        api_request("DELETE", f"/tasks/{task_id}")
+        print(f"Task {task_id} deleted")
+
+
 def cmd_tasks_wait(args):
-    """Wait for a task to transition from in-progress to another state."""
+    """Wait for a task to transition from in-progress to another state.
+
+    Polls start at --interval and back off by 1.5x per poll up to
+    --max-interval, so long waits poll at most once per --max-interval.
+    """
     import time
 
     poll_interval = args.interval
+    max_interval = max(args.max_interval, poll_interval)
     timeout = args.timeout
     start_time = time.time()
 
@@ -362,12 +567,13 @@ def cmd_tasks_wait(args):
 
     if initial_status != "inprogress":
         print(f"Task is not in-progress (current status: {initial_status})", file=sys.stderr)
-        print_json(result)
+        print_json(result, args.pretty)
         return
 
     print(f"Waiting for task {args.id} to complete...", file=sys.stderr)
     print(f"Current status: {initial_status}", file=sys.stderr)
 
+    delay = poll_interval
     while True:
         # Check timeout
         elapsed = time.time() - start_time
@@ -375,7 +581,12 @@ def cmd_tasks_wait(args):
             print(f"Timeout after {timeout} seconds", file=sys.stderr)
             sys.exit(1)
 
-        time.sleep(poll_interval)
+        if timeout:
+            # Don't sleep past the deadline
+            time.sleep(min(delay, timeout - elapsed))
+        else:
+            time.sleep(delay)
+        delay = min(max_interval, delay * 1.5)
 
         # Poll task status
         result = api_request("GET", f"/tasks/{args.id}")
@@ -384,7 +595,7 @@ def cmd_tasks_wait(args):
 
         if current_status != "inprogress":
             print(f"Task completed with status: {current_status}", file=sys.stderr)
-            print_json(result)
+            print_json(result, args.pretty)
             return
 
 
@@ -396,9 +607,9 @@ def cmd_attempts_list(args):
     """List attempts for a task."""
     result = api_request("GET", f"/tasks/{args.task_id}")
     if result and "attempts" in result:
-        print_json(result["attempts"])
+        print_json(result["attempts"], args.pretty)
     else:
-        print_json([])
+        print_json([], args.pretty)
 
 
 def cmd_attempts_create(args):
@@ -463,8 +674,8 @@ def cmd_attempts_pr(args):
 
 def cmd_tags_list(args):
     """List all tags."""
-    result = api_request("GET", "/tags")
-    print_json(result)
+    result = api_request("GET", "/tags", raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_tags_create(args):
@@ -501,8 +712,8 @@ def cmd_tags_delete(args):
 
 def cmd_config_get(args):
     """Get current configuration."""
-    result = api_request("GET", "/config")
-    print_json(result)
+    result = api_request("GET", "/config", raw=True)
+    print_raw_json(result, args.pretty)
 
 
 def cmd_config_update(args):
@@ -530,18 +741,16 @@ def cmd_executors_list(args):
     # Extract executors from the response
     if "data" in result and "executors" in result["data"]:
         executors = result["data"]["executors"]
-        print_json({"executors": executors})
+        print_json({"executors": executors}, args.pretty)
     else:
-        print_json(result)
+        print_json(result, args.pretty)
 
 
 # =============================================================================
 # Main CLI Setup
 # =============================================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="""Vibe Kanban CLI - Programmatic interface to Vibe Kanban
+MAIN_DESCRIPTION = """Vibe Kanban CLI - Programmatic interface to Vibe Kanban
 
 WHAT IS VIBE KANBAN?
   Vibe Kanban is an AI-powered Kanban board that automates coding tasks using
@@ -568,9 +777,9 @@ SERVER AUTO-DISCOVERY:
   port file at: /tmp/vibe-kanban/vibe-kanban.port
 
   If multiple servers are detected, you must explicitly specify which one to
-  connect to using the VIBE_API_URL environment variable.""",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+  connect to using the VIBE_API_URL environment variable."""
+
+MAIN_EPILOG = """
 ENVIRONMENT VARIABLES:
   VIBE_API_URL    Explicitly specify API base URL (e.g., http://127.0.0.1:50492/api)
                   Required when multiple Vibe Kanban servers are running.
@@ -606,38 +815,46 @@ COMMON WORKFLOWS:
 
   7. Batch delete all done tasks:
      %(prog)s tasks list --project-id <uuid> --status done | jq -r '.data[].id' | \\
-       xargs -I {} %(prog)s tasks delete {}
+       %(prog)s tasks delete-many
 
 TIPS:
   • Use 'jq' to parse JSON output for scripting
+  • get/list/wait output is compact JSON when piped; add --pretty to
+    indent it, or --no-pretty for compact JSON in a terminal
   • Task and project IDs are UUIDs
   • Executors: CLAUDE_CODE, GEMINI, CURSOR_AGENT, CODEX, OPENCODE
   • Task statuses: todo, in-progress, in-review, done, cancelled
 
 For more information, visit: https://github.com/vibe-teams/vibe-kanban
         """
-    )
 
-    parser.add_argument("-v", "--version", action="version",
-                        version=f"vibe-cli (modified: {get_version()})")
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+@functools.lru_cache(maxsize=1)
+def _output_parent():
+    """Parent parser with the output options of the read-only get/list/wait commands."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--pretty", action=argparse.BooleanOptionalAction,
+                        default=sys.stdout.isatty(),
+                        help="Indent JSON output; on by default when stdout is a terminal")
+    return parser
 
-    # -------------------------------------------------------------------------
-    # Projects
-    # -------------------------------------------------------------------------
+
+def _build_projects(subparsers):
     projects_parser = subparsers.add_parser("projects", help="Manage projects")
     projects_sub = projects_parser.add_subparsers(dest="subcommand")
 
     # projects list
-    projects_sub.add_parser("list", help="List all projects")
+    p = projects_sub.add_parser("list", help="List all projects", parents=[_output_parent()])
+    p.set_defaults(func=cmd_projects_list)
 
     # projects get
-    p = projects_sub.add_parser("get", help="Get a project")
+    p = projects_sub.add_parser("get", help="Get a project", parents=[_output_parent()])
+    p.set_defaults(func=cmd_projects_get)
     p.add_argument("id", help="Project ID (UUID)")
 
     # projects create
     p = projects_sub.add_parser("create", help="Create a project")
+    p.set_defaults(func=cmd_projects_create)
     p.add_argument("--name", required=True, help="Project name")
     p.add_argument("--git-repo-path", required=True, help="Path to git repository")
     p.add_argument("--setup-script", help="Setup script to run")
@@ -646,6 +863,7 @@ For more information, visit: https://github.com/vibe-teams/vibe-kanban
 
     # projects update
     p = projects_sub.add_parser("update", help="Update a project")
+    p.set_defaults(func=cmd_projects_update)
     p.add_argument("id", help="Project ID (UUID)")
     p.add_argument("--name", help="New project name")
     p.add_argument("--git-repo-path", help="New git repo path")
@@ -655,39 +873,43 @@ For more information, visit: https://github.com/vibe-teams/vibe-kanban
 
     # projects delete
     p = projects_sub.add_parser("delete", help="Delete a project")
+    p.set_defaults(func=cmd_projects_delete)
     p.add_argument("id", help="Project ID (UUID)")
 
-    # -------------------------------------------------------------------------
-    # Tasks
-    # -------------------------------------------------------------------------
+
+def _build_tasks(subparsers):
     tasks_parser = subparsers.add_parser("tasks", help="Manage tasks")
     tasks_sub = tasks_parser.add_subparsers(dest="subcommand")
 
     # tasks list
-    p = tasks_sub.add_parser("list", help="List tasks")
+    p = tasks_sub.add_parser("list", help="List tasks", parents=[_output_parent()])
+    p.set_defaults(func=cmd_tasks_list)
     p.add_argument("--project-id", required=True, help="Project ID (UUID)")
-    p.add_argument("--status", choices=["todo", "in-progress", "in-review", "done", "cancelled"],
+    p.add_argument("--status", choices=STATUS_CHOICES,
                    help="Filter by status")
 
     # tasks get
-    p = tasks_sub.add_parser("get", help="Get a task")
+    p = tasks_sub.add_parser("get", help="Get a task", parents=[_output_parent()])
+    p.set_defaults(func=cmd_tasks_get)
     p.add_argument("id", help="Task ID (UUID)")
 
     # tasks create
     p = tasks_sub.add_parser("create", help="Create a task")
+    p.set_defaults(func=cmd_tasks_create)
     p.add_argument("--project-id", required=True, help="Project ID (UUID)")
     p.add_argument("--title", required=True, help="Task title")
     p.add_argument("--description", help="Task description")
-    p.add_argument("--status", choices=["todo", "in-progress", "in-review", "done", "cancelled"],
+    p.add_argument("--status", choices=STATUS_CHOICES,
                    default="todo", help="Initial status (default: todo)")
 
     # tasks create-and-start
     p = tasks_sub.add_parser("create-and-start", help="Create a task and start an attempt immediately")
+    p.set_defaults(func=cmd_tasks_create_and_start)
     p.add_argument("--project-id", required=True, help="Project ID (UUID)")
     p.add_argument("--title", required=True, help="Task title")
     p.add_argument("--description", help="Task description")
     p.add_argument("--executor", required=True,
-                   choices=["CLAUDE_CODE", "CODEX", "GEMINI", "CURSOR_AGENT", "OPENCODE"],
+                   choices=EXECUTOR_CHOICES,
                    help="Executor to use")
     p.add_argument("--base-branch", required=True, help="Base branch name")
     p.add_argument("--custom-branch", help="Custom branch name (optional, overrides auto-generated branch)")
@@ -696,117 +918,183 @@ For more information, visit: https://github.com/vibe-teams/vibe-kanban
 
     # tasks update
     p = tasks_sub.add_parser("update", help="Update a task")
+    p.set_defaults(func=cmd_tasks_update)
     p.add_argument("id", help="Task ID (UUID)")
     p.add_argument("--title", help="New title")
     p.add_argument("--description", help="New description")
-    p.add_argument("--status", choices=["todo", "in-progress", "in-review", "done", "cancelled"],
+    p.add_argument("--status", choices=STATUS_CHOICES,
                    help="New status")
 
     # tasks delete
     p = tasks_sub.add_parser("delete", help="Delete a task")
+    p.set_defaults(func=cmd_tasks_delete)
     p.add_argument("id", help="Task ID (UUID)")
 
+    # tasks delete-many
+    p = tasks_sub.add_parser("delete-many", help="Delete tasks read from stdin (one ID per line)")
+    p.set_defaults(func=cmd_tasks_delete_many)
+
     # tasks wait
-    p = tasks_sub.add_parser("wait", help="Wait for a task to transition from in-progress to another state")
+    p = tasks_sub.add_parser("wait", help="Wait for a task to transition from in-progress to another state",
+                             parents=[_output_parent()])
+    p.set_defaults(func=cmd_tasks_wait)
     p.add_argument("id", help="Task ID (UUID)")
     p.add_argument("--interval", type=float, default=2.0,
-                   help="Polling interval in seconds (default: 2.0)")
+                   help="Initial polling interval in seconds (default: 2.0)")
+    p.add_argument("--max-interval", type=float, default=30.0,
+                   help="Maximum polling interval after backoff in seconds (default: 30.0)")
     p.add_argument("--timeout", type=float, default=None,
                    help="Timeout in seconds (default: no timeout)")
 
-    # -------------------------------------------------------------------------
-    # Attempts
-    # -------------------------------------------------------------------------
+
+def _build_attempts(subparsers):
     attempts_parser = subparsers.add_parser("attempts", help="Manage task attempts")
     attempts_sub = attempts_parser.add_subparsers(dest="subcommand")
 
     # attempts list
-    p = attempts_sub.add_parser("list", help="List attempts for a task")
+    p = attempts_sub.add_parser("list", help="List attempts for a task", parents=[_output_parent()])
+    p.set_defaults(func=cmd_attempts_list)
     p.add_argument("--task-id", required=True, help="Task ID (UUID)")
 
     # attempts create
     p = attempts_sub.add_parser("create", help="Create a task attempt")
+    p.set_defaults(func=cmd_attempts_create)
     p.add_argument("--task-id", required=True, help="Task ID (UUID)")
     p.add_argument("--executor", required=True,
-                   choices=["CLAUDE_CODE", "CODEX", "GEMINI", "CURSOR_AGENT", "OPENCODE"],
+                   choices=EXECUTOR_CHOICES,
                    help="Executor to use")
     p.add_argument("--base-branch", required=True, help="Base branch name")
     p.add_argument("--custom-branch", help="Custom branch name (optional, overrides auto-generated branch)")
 
     # attempts followup
     p = attempts_sub.add_parser("followup", help="Send follow-up prompt")
+    p.set_defaults(func=cmd_attempts_followup)
     p.add_argument("id", help="Attempt ID (UUID)")
     p.add_argument("--prompt", required=True, help="Follow-up prompt")
     p.add_argument("--variant", help="Variant identifier")
 
     # attempts stop
     p = attempts_sub.add_parser("stop", help="Stop an attempt")
+    p.set_defaults(func=cmd_attempts_stop)
     p.add_argument("id", help="Attempt ID (UUID)")
 
     # attempts merge
     p = attempts_sub.add_parser("merge", help="Merge attempt changes")
+    p.set_defaults(func=cmd_attempts_merge)
     p.add_argument("id", help="Attempt ID (UUID)")
 
     # attempts push
     p = attempts_sub.add_parser("push", help="Push attempt branch")
+    p.set_defaults(func=cmd_attempts_push)
     p.add_argument("id", help="Attempt ID (UUID)")
     p.add_argument("--force", action="store_true", help="Force push")
 
     # attempts pr
     p = attempts_sub.add_parser("pr", help="Create pull request")
+    p.set_defaults(func=cmd_attempts_pr)
     p.add_argument("id", help="Attempt ID (UUID)")
     p.add_argument("--title", required=True, help="PR title")
     p.add_argument("--body", help="PR body/description")
     p.add_argument("--target-branch", help="Target branch for PR")
 
-    # -------------------------------------------------------------------------
-    # Tags
-    # -------------------------------------------------------------------------
+
+def _build_tags(subparsers):
     tags_parser = subparsers.add_parser("tags", help="Manage tags")
     tags_sub = tags_parser.add_subparsers(dest="subcommand")
 
     # tags list
-    tags_sub.add_parser("list", help="List all tags")
+    p = tags_sub.add_parser("list", help="List all tags", parents=[_output_parent()])
+    p.set_defaults(func=cmd_tags_list)
 
     # tags create
     p = tags_sub.add_parser("create", help="Create a tag")
+    p.set_defaults(func=cmd_tags_create)
     p.add_argument("--name", required=True, help="Tag name (no spaces)")
     p.add_argument("--content", help="Tag content")
 
     # tags update
     p = tags_sub.add_parser("update", help="Update a tag")
+    p.set_defaults(func=cmd_tags_update)
     p.add_argument("id", help="Tag ID (UUID)")
     p.add_argument("--name", help="New tag name")
     p.add_argument("--content", help="New content")
 
     # tags delete
     p = tags_sub.add_parser("delete", help="Delete a tag")
+    p.set_defaults(func=cmd_tags_delete)
     p.add_argument("id", help="Tag ID (UUID)")
 
-    # -------------------------------------------------------------------------
-    # Config
-    # -------------------------------------------------------------------------
+
+def _build_config(subparsers):
     config_parser = subparsers.add_parser("config", help="Manage configuration")
     config_sub = config_parser.add_subparsers(dest="subcommand")
 
     # config get
-    config_sub.add_parser("get", help="Get current config")
+    p = config_sub.add_parser("get", help="Get current config", parents=[_output_parent()])
+    p.set_defaults(func=cmd_config_get)
 
     # config update
     p = config_sub.add_parser("update", help="Update config")
+    p.set_defaults(func=cmd_config_update)
     p.add_argument("--git-branch-prefix", help="Git branch prefix")
     p.add_argument("--editor", help="Editor command")
     p.add_argument("--analytics-enabled", type=lambda x: x.lower() == "true",
                    help="Enable analytics (true/false)")
 
-    # -------------------------------------------------------------------------
-    # Executors
-    # -------------------------------------------------------------------------
+
+def _build_executors(subparsers):
     executors_parser = subparsers.add_parser("executors", help="List available executors and their configuration")
     executors_sub = executors_parser.add_subparsers(dest="subcommand")
 
     # executors list
-    executors_sub.add_parser("list", help="List all available executors")
+    p = executors_sub.add_parser("list", help="List all available executors", parents=[_output_parent()])
+    p.set_defaults(func=cmd_executors_list)
+
+
+# Command name -> subparser builder, in the order shown by `vibe --help`
+COMMAND_BUILDERS = {
+    "projects": _build_projects,
+    "tasks": _build_tasks,
+    "attempts": _build_attempts,
+    "tags": _build_tags,
+    "config": _build_config,
+    "executors": _build_executors,
+}
+
+
+def _requested_command(argv):
+    """Get the command named in argv, or None if top-level help was requested first."""
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def main():
+    # Only build the subparser for the requested command. Top-level help
+    # (including `-h` before a command), --version, a missing command or an
+    # unknown one fall back to building everything so help output and
+    # argparse's choice errors stay complete.
+    command = _requested_command(sys.argv[1:])
+    if command in COMMAND_BUILDERS:
+        builders = [COMMAND_BUILDERS[command]]
+        parser = argparse.ArgumentParser()
+    else:
+        builders = COMMAND_BUILDERS.values()
+        parser = argparse.ArgumentParser(
+            description=MAIN_DESCRIPTION,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=MAIN_EPILOG,
+        )
+
+    parser.add_argument("-v", "--version", action="version",
+                        version=f"vibe-cli (modified: {get_version()})")
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for build in builders:
+        build(subparsers)
 
     # -------------------------------------------------------------------------
     # Parse and dispatch
@@ -817,25 +1105,12 @@ For more information, visit: https://github.com/vibe-teams/vibe-kanban
         parser.print_help()
         sys.exit(1)
 
-    # Build command handler name
-    if hasattr(args, "subcommand") and args.subcommand:
-        # Normalize hyphens to underscores for handler lookup
-        subcommand = args.subcommand.replace("-", "_")
-        handler_name = f"cmd_{args.command}_{subcommand}"
-    else:
-        # Show subcommand help if no subcommand given
-        subparser = subparsers.choices.get(args.command)
-        if subparser:
-            subparser.print_help()
+    # Show subcommand help if no subcommand given
+    if not hasattr(args, "func"):
+        subparsers.choices[args.command].print_help()
         sys.exit(1)
 
-    # Get and call handler
-    handler = globals().get(handler_name)
-    if handler:
-        handler(args)
-    else:
-        print(f"Unknown command: {args.command} {args.subcommand}", file=sys.stderr)
-        sys.exit(1)
+    args.func(args)
 
 
 if __name__ == "__main__":